@@ -7,6 +7,7 @@ these values to the main application via a callback function.
 Constants:
 - FONTS: A list of available font styles for selection.
 - COLORS_AND_CODE: A dictionary mapping color names to their corresponding hexadecimal color codes.
+- MIN_FONT_SIZE, MAX_FONT_SIZE: Range of font sizes accepted by the size selector.
 
 Classes:
 - TextMenu: Inherits from `tk.Toplevel` to create a separate pop-up window for text settings.
@@ -45,6 +46,14 @@ COLORS_AND_CODE = {
     "White": "#ffffff",
 }
 
+MIN_FONT_SIZE = 30
+MAX_FONT_SIZE = 80
+
+# Combobox values, built once instead of on every window
+_COLOR_NAMES = tuple(COLORS_AND_CODE.keys())
+_COLOR_CODES = tuple(COLORS_AND_CODE.values())
+_FONT_NAMES = tuple(FONTS)
+
 
 class TextMenu(tk.Toplevel):
     """
@@ -69,6 +78,8 @@ class TextMenu(tk.Toplevel):
             callback (function): A function that will be invoked with the text settings once the user applies changes.
         """
         super().__init__(*args, **kwargs)
+        TextMenu.in_use = True
+        self.protocol("WM_DELETE_WINDOW", self.close_window)
         self.callback = callback
         self.title("Text Menu Settings")
         self.config(padx=40, pady=40)
@@ -88,7 +99,7 @@ class TextMenu(tk.Toplevel):
         self.color_label.grid(row=1, column=0)
 
         # Color ComboBox
-        self.color_box = ttk.Combobox(self, values=[color for color in COLORS_AND_CODE], state='readonly')
+        self.color_box = ttk.Combobox(self, values=_COLOR_NAMES, state='readonly')
         self.color_box.grid(row=1, column=1)
 
         # Font Size Label
@@ -96,7 +107,7 @@ class TextMenu(tk.Toplevel):
         self.font_size.grid(row=2, column=0)
 
         # Font Size SpinBox
-        self.spinbox = ttk.Spinbox(self, from_=30, to=80, width=7, state='readonly')
+        self.spinbox = ttk.Spinbox(self, from_=MIN_FONT_SIZE, to=MAX_FONT_SIZE, width=7, state='readonly')
         self.spinbox.grid(row=2, column=1)
 
         # Font Label
@@ -104,7 +115,7 @@ class TextMenu(tk.Toplevel):
         self.font.grid(row=3, column=0)
 
         # Font ComboBox
-        self.font_box = ttk.Combobox(self, values=[font for font in FONTS], state='readonly')
+        self.font_box = ttk.Combobox(self, values=_FONT_NAMES, state='readonly')
         self.font_box.grid(row=3, column=1)
 
         # Apply Button
@@ -119,16 +130,23 @@ class TextMenu(tk.Toplevel):
         """
         Validates the input values from the user and sends them to the callback function.
 
-        If any field is incomplete, displays an informational message to complete all fields.
+        If any field is incomplete, displays an informational message to complete all fields. The font size is
+        checked and converted here so the callback always receives an `int` within the accepted range.
         """
         font_size_value = self.spinbox.get()
-        color_value = self.color_box.get()
+        color_index = self.color_box.current()
         text_value = self.text_entry.get()
         font_value = self.font_box.get()
 
-        if font_size_value != '' and color_value != '' and text_value != '' and font_value != '':
+        if font_size_value != '' and color_index >= 0 and text_value != '' and font_value != '':
+            if not font_size_value.isdigit() or not MIN_FONT_SIZE <= int(font_size_value) <= MAX_FONT_SIZE:
+                tkinter.messagebox.showinfo(
+                    title="Invalid Font Size",
+                    message=f"The font size must be a number between {MIN_FONT_SIZE} and {MAX_FONT_SIZE}."
+                )
+                return
             if self.callback:
-                self.callback(text_value, COLORS_AND_CODE.get(color_value), font_size_value, font_value)
+                self.callback(text_value, _COLOR_CODES[color_index], int(font_size_value), font_value)
             self.close_window()
         else:
             tkinter.messagebox.showinfo(
@@ -140,4 +158,5 @@ class TextMenu(tk.Toplevel):
         """
         Closes the TextMenu window and releases any resources it is holding.
         """
+        TextMenu.in_use = False
         self.destroy()
@@ -2,29 +2,176 @@
 ImageWindowMaker: A class to create a desktop application for adding watermarks to images using Tkinter.
 
 Required Modules:
-- os.path
-- tkinter (including filedialog and messagebox)
+- os
+- concurrent.futures (ThreadPoolExecutor)
+- tkinter (including filedialog, messagebox and font)
 - PIL (Image, ImageTk, ImageDraw, ImageFont)
 - text_menu_ui (external class: TextMenu)
 
 Constants:
 - BACKGROUND_COLOR: Background color of the main window.
 - FRONT_COLOR: Background color of the application canvas.
+- PREVIEW_RESAMPLE: Fast filter (BILINEAR) used for the on-screen preview, where Tk shows no subpixel detail.
+- SAVE_RESAMPLE: High quality filter (LANCZOS) used only for the image written to disk.
+- _ALPHA_FORMATS: Output formats that keep transparency, every other format is saved as RGB.
+- _FONT_FILES: Candidate bold TrueType file names for each font offered by TextMenu.
+- _FONT_DIRS: System directories searched for those files.
+- _FONT_PATH_CACHE: Font name to file path mapping, resolved once at import time.
+
+Performance:
+- Every resize, composite and save goes through PIL. Pillow-SIMD is an API compatible build of Pillow with vectorized
+  (SSE4/AVX2) kernels for those operations and can replace it without code changes:
+      pip uninstall Pillow
+      CC="cc -mavx2" pip install pillow-simd
+  The PIL build in use is printed when the window is created; Pillow-SIMD versions end in `.postN`.
 
 Classes:
 - ImageWindowMaker: Inherits from `tk.Tk` and handles the complete graphical interface logic for selecting, editing, and saving images with watermarks.
 """
 
-import os.path
-from tkinter import *
-import tkinter.filedialog, tkinter.messagebox
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+import tkinter.filedialog, tkinter.messagebox, tkinter.font
 import tkinter as tk
-from text_menu_ui import TextMenu
+from text_menu_ui import TextMenu, FONTS
+import PIL
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 
 
 BACKGROUND_COLOR = "#fcf3cf"
 FRONT_COLOR = "#f6ddcc"
+# Image.Resampling only exists from Pillow 9.1, older Pillow-SIMD builds keep the filters on Image
+PREVIEW_RESAMPLE = getattr(Image, "Resampling", Image).BILINEAR
+SAVE_RESAMPLE = getattr(Image, "Resampling", Image).LANCZOS
+
+# Output formats that can store the alpha channel of transparent sources
+_ALPHA_FORMATS = {"PNG", "WEBP", "TIFF", "TGA", "ICO"}
+
+# Bold font files used by Windows, macOS and the Linux core fonts packages, matched case-insensitively.
+# The preview draws the text in bold, the regular files are only a fallback for fonts without a bold face.
+# Systems without the Microsoft fonts fall back to the metric-compatible Liberation faces, then DejaVu Sans.
+_FONT_FILES = {
+    "Arial": ("arialbd.ttf", "arial bold.ttf", "arial_bold.ttf", "arial.ttf", "liberationsans-bold.ttf"),
+    "Verdana": ("verdanab.ttf", "verdana bold.ttf", "verdana_bold.ttf", "verdana.ttf", "liberationsans-bold.ttf"),
+    "Times New Roman": ("timesbd.ttf", "times new roman bold.ttf", "times_new_roman_bold.ttf", "times.ttf",
+                        "liberationserif-bold.ttf"),
+    "Courier New": ("courbd.ttf", "courier new bold.ttf", "courier_new_bold.ttf", "cour.ttf",
+                    "liberationmono-bold.ttf"),
+    "Georgia": ("georgiab.ttf", "georgia bold.ttf", "georgia_bold.ttf", "georgia.ttf", "liberationserif-bold.ttf"),
+    "Comic Sans MS": ("comicbd.ttf", "comic sans ms bold.ttf", "comic_sans_ms_bold.ttf", "comic.ttf"),
+    "Trebuchet MS": ("trebucbd.ttf", "trebuchet ms bold.ttf", "trebuchet_ms_bold.ttf", "trebuc.ttf",
+                     "liberationsans-bold.ttf"),
+    "Impact": ("impact.ttf",),
+    "Lucida Console": ("lucon.ttf", "liberationmono-bold.ttf"),
+    "Tahoma": ("tahomabd.ttf", "tahoma bold.ttf", "tahoma.ttf", "liberationsans-bold.ttf")
+}
+_FONT_FILES = {name: files + ("dejavusans-bold.ttf",) for name, files in _FONT_FILES.items()}
+
+_FONT_DIRS = [
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    os.path.expanduser("~/.local/share/fonts")
+]
+
+
+def _find_font_paths():
+    """
+    Walks the system font directories once and resolves the file of every font in `FONTS`.
+
+    Returns:
+        dict: Maps each font name to the absolute path of its TrueType file. Fonts that are not installed are left out.
+    """
+    installed = {}
+    for font_dir in _FONT_DIRS:
+        for root, _, files in os.walk(font_dir):
+            for file in files:
+                installed.setdefault(file.lower(), os.path.join(root, file))
+
+    font_paths = {}
+    for name in FONTS:
+        for file in _FONT_FILES.get(name, ()):
+            if file in installed:
+                font_paths[name] = installed[file]
+                break
+    return font_paths
+
+
+_FONT_PATH_CACHE = _find_font_paths()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_font(name, size):
+    """
+    Loads a TrueType font once per (name, size) pair and reuses it on later saves.
+
+    Parameters:
+        name (str): One of the font names listed in `FONTS`.
+        size (int): Font size in pixels, as expected by `ImageFont.truetype`.
+
+    Returns:
+        ImageFont.FreeTypeFont: The loaded font, or PIL's default font at the same size if the file cannot be found.
+    """
+    font_path = _FONT_PATH_CACHE.get(name)
+    if font_path is not None:
+        return ImageFont.truetype(font_path, size)
+    try:
+        # Pillow 10.1+ ships a scalable default font
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _render_watermark(text, color, font_size, font_name):
+    """
+    Renders the watermark text into a transparent 600x600 layer.
+
+    Parameters:
+        text (str): The watermark text.
+        color (str): Hexadecimal code of the text color.
+        font_size (int): Font size in pixels.
+        font_name (str): One of the font names listed in `FONTS`.
+
+    Returns:
+        PIL.Image.Image: RGBA layer that is transparent everywhere except the text.
+    """
+    wm_layer = Image.new("RGBA", (600, 600), (0, 0, 0, 0))
+    font = _get_font(font_name, font_size)
+    ImageDraw.Draw(wm_layer).text((300, 500), text, fill=color, font=font, anchor="ms")
+    return wm_layer
+
+
+def _do_save(source, save_pil, wm_settings, wm_layer, keep_alpha, path):
+    """
+    Composites the watermark layer over the image and writes it to disk. Runs on the save worker thread.
+
+    Parameters:
+        source (PIL.Image.Image): The decoded RGBA source image.
+        save_pil (PIL.Image.Image): Cached 600x600 base from a previous save, None to resample it from `source`.
+        wm_settings (tuple): (text, color, font size in pixels, font name) of the watermark, None to save without one.
+        wm_layer (PIL.Image.Image): Cached layer rendered from `wm_settings`, None to render it here.
+        keep_alpha (bool): Whether the source was transparent. Opaque sources are always saved as RGB.
+        path (str): Absolute path of the output file.
+
+    Returns:
+        tuple: The path the image was saved to, the 600x600 base and the watermark layer, so both can be reused.
+    """
+    if save_pil is None:
+        save_pil = source.resize((600, 600), SAVE_RESAMPLE) if source.size != (600, 600) else source
+    if wm_layer is None and wm_settings is not None:
+        wm_layer = _render_watermark(*wm_settings)
+    output = Image.alpha_composite(save_pil, wm_layer) if wm_layer is not None else save_pil
+    # Only keep the alpha channel when the source had one and the chosen format can store it
+    output_format = Image.registered_extensions().get(os.path.splitext(path)[1].lower())
+    if not keep_alpha or output_format not in _ALPHA_FORMATS:
+        output = output.convert("RGB")
+    output.save(path)
+    return path, save_pil, wm_layer
 
 
 class ImageWindowMaker(tk.Tk):
@@ -38,7 +185,17 @@ class ImageWindowMaker(tk.Tk):
         app_image (tk.PhotoImage): Icon image loaded on the main canvas.
         search_file (str): Path of the selected image file.
         new_image (ImageTk.PhotoImage): Resized image loaded onto the canvas.
-        text_watermarker (int): ID of the watermark text on the canvas.
+        _source_pil (PIL.Image.Image): Decoded source image, kept open while editing.
+        _source_has_alpha (bool): Indicates whether the source image had transparency.
+        _display_pil (PIL.Image.Image): 600x600 preview of the source, resampled with `PREVIEW_RESAMPLE`.
+        _save_pil (PIL.Image.Image): 600x600 base for saving, resampled with `SAVE_RESAMPLE` on the first save.
+        _wm_layer (PIL.Image.Image): Transparent layer rendered by the save worker, None until the next save renders it.
+        _io_pool (ThreadPoolExecutor): Single worker that writes images to disk off the Tk thread.
+        text_watermarker (int): ID of the watermark text on the canvas, None until a text is applied.
+        _last_wm (tuple): Last (text, color, size, font) applied to the canvas, used to skip identical re-applies.
+        _pending_update (bool): Indicates whether a canvas update is already scheduled with `after_idle`.
+        _font_cache (dict): Maps (font name, size) to the `tkinter.font.Font` used by the canvas preview.
+        _px_per_point (float): Screen pixels per point, used to render the saved text at the preview size.
         watermark_text (str): Watermark text entered by the user.
         text_color (str): Selected color for the watermark text.
         font_size (int): Font size for the watermark text.
@@ -46,14 +203,18 @@ class ImageWindowMaker(tk.Tk):
 
     Methods:
         __init__(*args, **kwargs): Initializes the main window.
+        create_widgets(): Creates all the widgets once so menu transitions only toggle them.
         menu_start(): Loads the main interface for selecting images.
         change_menu(): Switches the interface to allow editing of the selected image.
         add_image(): Loads the selected image and resizes it to fit the canvas.
         save_image(): Saves the image with the watermark to the selected location.
+        _poll_save(future, source, wm_state): Waits on the Tk thread for a save to finish.
+        _save_done(future, source, wm_state): Caches the rendered pieces and reports the result on the Tk thread.
         setting_buttons(state): Configures the interface buttons based on the current state.
         return_to_principal(): Returns to the main screen and resets graphical elements.
         open_text_settings(): Opens a secondary window for entering watermark data.
         values_received(r_text, r_color_text, r_font_size, r_font_value): Receives watermark values and applies them to the canvas.
+        _flush_watermark(): Applies the latest watermark values to the canvas in a single update.
     """
 
     def __init__(self, *args, **kwargs):
@@ -63,30 +224,74 @@ class ImageWindowMaker(tk.Tk):
         super().__init__(*args, **kwargs)
         self.title("Image Watermarking App")
         self.config(padx=40, pady=40, bg=BACKGROUND_COLOR)
+        # Shared widget defaults, set once in the option database instead of on every widget
+        self.option_add('*Button.highlightThickness', 0)
+        self.option_add('*Button.width', 10)
+        self.option_add('*Canvas.highlightThickness', 0)
+        # Report which PIL build handles the image processing and which fonts fall back to the default one
+        if ".post" in PIL.__version__:
+            print(f"Using Pillow-SIMD {PIL.__version__}")
+        else:
+            print(f"Using Pillow {PIL.__version__}, install pillow-simd for faster image processing.")
+        missing_fonts = [name for name in FONTS if name not in _FONT_PATH_CACHE]
+        if missing_fonts:
+            print(f"Fonts not found, saved images will use PIL's default font for: {', '.join(missing_fonts)}")
         self.in_principal = True
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._last_wm = None
+        self._pending_update = False
+        self._font_cache = {}
+        # Tk font sizes are in points, PIL renders in pixels
+        self._px_per_point = self.winfo_fpixels('1p')
+        self.create_widgets()
         self.menu_start()
         self.mainloop()
+        # Let a save that is already running finish, drop the ones that never started
+        self._io_pool.shutdown(wait=True, cancel_futures=True)
 
-    def menu_start(self):
+    def create_widgets(self):
         """
-        Configures the main screen to allow image selection.
+        Creates every widget of the window once. The menus only show or hide them afterwards.
         """
         # Creating the canvas and graphical elements
-        self.canvas = Canvas(width=600, height=600)
-        self.app_title = self.canvas.create_text(300, 100, text='Add a Watermark', font=('TkMenuFont', 30, 'bold'))
-        self.app_image = PhotoImage(file="images/watermaker_icon.png")
+        self.canvas = tk.Canvas(width=600, height=600)
+        self.app_image = tk.PhotoImage(file="images/watermaker_icon.png")
         self.logo = self.canvas.create_image(300, 300, image=self.app_image)
-        self.canvas.config(bg=FRONT_COLOR, highlightthickness=0)
+        self.canvas.config(bg=FRONT_COLOR)
         self.canvas.grid(row=0, column=0, columnspan=2)
 
         # Button to select file
-        self.select_file_button = Button(text="Select File", highlightthickness=0, command=self.change_menu, width=10)
-        self.select_file_button.grid(row=1, column=0, columnspan=2, pady=15)
+        self.select_file_button = tk.Button(text="Select File", command=self.change_menu)
 
         # Credits label
-        self.credit_label = Label(text='Desktop App Made by Gerardo-HG', fg='white', font=("Ariel", 20, "bold"))
+        self.credit_label = tk.Label(text='Desktop App Made by Gerardo-HG', fg='white', font=("Ariel", 20, "bold"))
+
+        # Button to insert text
+        self.insert_text_button = tk.Button(text="Insert a text", command=self.open_text_settings)
+
+        # Button to save the image
+        self.save_button = tk.Button(text="Save Image", command=self.save_image)
+
+        # Button to return
+        self.return_button = tk.Button(text='Return', command=self.return_to_principal)
+
+    def menu_start(self):
+        """
+        Configures the main screen to allow image selection.
+        """
+        # Hide the editing widgets before showing the main ones
+        self.insert_text_button.grid_forget()
+        self.save_button.grid_forget()
+        self.return_button.grid_forget()
+
+        self.app_title = self.canvas.create_text(300, 100, text='Add a Watermark', font=('TkMenuFont', 30, 'bold'))
+        self.canvas.itemconfig(self.logo, image=self.app_image)
+        self.select_file_button.grid(row=1, column=0, columnspan=2, pady=15)
         self.credit_label.grid(row=2, column=0, columnspan=2, pady=25)
 
+        # Single geometry pass for the whole transition
+        self.update_idletasks()
+
     def change_menu(self):
         """
         Allows the user to select an image and switches to the editing interface if a valid file is selected.
@@ -100,38 +305,86 @@ class ImageWindowMaker(tk.Tk):
             self.credit_label.grid_forget()
             self.setting_buttons(self.in_principal)
             self.add_image()
+            self.update_idletasks()
 
     def add_image(self):
         """
         Loads the selected image onto the canvas and resizes it to 600x600 pixels.
         """
-        self.text_watermarker = self.canvas.create_text(300, 500, width=500, text="")
-        new_image = Image.open(self.search_file)
-        resized_image = new_image.resize((600, 600))
-        self.new_image = ImageTk.PhotoImage(resized_image)
+        self.text_watermarker = None
+        self._last_wm = None
+        self._wm_layer = None
+        # Decode and resize once, the same image is reused when saving
+        source = Image.open(self.search_file)
+        # Let the decoder shrink on load where the format supports it (JPEG), no-op otherwise
+        source.draft(None, (1200, 1200))
+        self._source_has_alpha = source.mode in ("RGBA", "LA", "PA") or "transparency" in source.info
+        self._source_pil = source.convert("RGBA")
+        source.close()
+        if self._source_pil.size != (600, 600):
+            self._display_pil = self._source_pil.resize((600, 600), PREVIEW_RESAMPLE, reducing_gap=2.0)
+        else:
+            self._display_pil = self._source_pil.copy()
+        # The quality render is only built if the user actually saves
+        self._save_pil = None
+        self.new_image = ImageTk.PhotoImage(self._display_pil)
         self.canvas.itemconfig(self.logo, image=self.new_image)
 
     def save_image(self):
         """
         Saves the edited image with the watermark to the user-selected location.
         """
-        file_to_save = tkinter.filedialog.asksaveasfile(mode='w', defaultextension='.png',
+        abs_path = tkinter.filedialog.asksaveasfilename(defaultextension='.png',
                                                         filetypes=(("PNG file", "*.png"), ("All File", "*.*")))
-        if file_to_save:
-            abs_path = os.path.abspath(file_to_save.name)
-            editable_image = Image.open(self.search_file).resize((600, 600))
-            draw = ImageDraw.Draw(editable_image)
+        if not abs_path:
+            return
 
-            text_value = self.canvas.itemcget(self.text_watermarker, "text")
+        # Resampling, text rendering, compositing and encoding happen on the worker,
+        # the Tk thread polls for the result
+        source = self._source_pil
+        wm_state = self._last_wm
+        wm_settings = None
+        if wm_state is not None:
+            wm_settings = (self.watermark_text, self.text_color, round(self.font_size * self._px_per_point),
+                           self.font_value)
+        future = self._io_pool.submit(_do_save, source, self._save_pil, wm_settings, self._wm_layer,
+                                      self._source_has_alpha, abs_path)
+        self.after(50, self._poll_save, future, source, wm_state)
 
-            font_path = "path_to_font.ttf"
-            try:
-                font = ImageFont.truetype(font_path, int(self.font_size))
-            except IOError:
-                font = ImageFont.load_default()
+    def _poll_save(self, future, source, wm_state):
+        """
+        Checks from the Tk thread whether the save worker has finished, so the worker never calls into Tk.
 
-            draw.text((300, 500), text_value, fill=self.text_color, font=font, anchor="ms")
-            editable_image.save(abs_path)
+        Parameters:
+            future (concurrent.futures.Future): The submitted save task.
+            source (PIL.Image.Image): The source image the task was submitted with.
+            wm_state (tuple): The applied watermark values the task was submitted with.
+        """
+        if future.done():
+            self._save_done(future, source, wm_state)
+        else:
+            self.after(50, self._poll_save, future, source, wm_state)
+
+    def _save_done(self, future, source, wm_state):
+        """
+        Notifies the user once the save worker has finished and keeps the resampled base and watermark layer
+        for later saves.
+
+        Parameters:
+            future (concurrent.futures.Future): The finished save task.
+            source (PIL.Image.Image): The source image the task was submitted with.
+            wm_state (tuple): The applied watermark values the task was submitted with.
+        """
+        try:
+            abs_path, save_pil, wm_layer = future.result()
+        except (OSError, ValueError) as error:
+            tk.messagebox.showerror(title="Image not saved", message=f"The file could not be saved.\n{error}")
+        else:
+            # Only cache the rendered pieces if they still match the image and watermark being edited
+            if source is self._source_pil and self._save_pil is None:
+                self._save_pil = save_pil
+            if source is self._source_pil and wm_state == self._last_wm and self._wm_layer is None:
+                self._wm_layer = wm_layer
             tk.messagebox.showinfo(title="Image saved", message=f"File saved correctly.")
             print(f"Image saved in: {abs_path}")
 
@@ -141,18 +394,8 @@ class ImageWindowMaker(tk.Tk):
         """
         if not state:
             self.select_file_button.grid_forget()
-
-            # Button to insert text
-            self.insert_text_button = Button(text="Insert a text", highlightthickness=0,
-                                             command=self.open_text_settings, width=10)
             self.insert_text_button.grid(row=1, column=0, pady=15, padx=15)
-
-            # Button to save the image
-            self.save_button = Button(text="Save Image", highlightthickness=0, command=self.save_image, width=10)
             self.save_button.grid(row=1, column=1, pady=15, padx=15)
-
-            # Button to return
-            self.return_button = Button(text='Return', highlightthickness=0, command=self.return_to_principal, width=10)
             self.return_button.grid(row=0, column=2, padx=15)
 
     def return_to_principal(self):
@@ -160,9 +403,10 @@ class ImageWindowMaker(tk.Tk):
         Resets the main screen and its graphical elements.
         """
         self.in_principal = True
-        self.insert_text_button.grid_forget()
-        self.return_button.grid_forget()
-        self.save_button.grid_forget()
+        # Closed on the worker so saves that are still queued can finish with it
+        self._io_pool.submit(self._source_pil.close)
+        if self.text_watermarker is not None:
+            self.canvas.delete(self.text_watermarker)
         self.menu_start()
 
     def open_text_settings(self):
@@ -179,13 +423,35 @@ class ImageWindowMaker(tk.Tk):
         Parameters:
             r_text (str): The watermark text.
             r_color_text (str): Hexadecimal code for the selected text color.
-            r_font_size (int): The selected font size.
+            r_font_size (int): The selected font size, already validated by TextMenu.
             r_font_value (str): The selected font name.
         """
+        new_state = (r_text, r_color_text, r_font_size, r_font_value)
+        if new_state == self._last_wm:
+            return
+        self._last_wm = new_state
+        self._wm_layer = None
+
         self.watermark_text = r_text
         self.text_color = r_color_text
         self.font_size = r_font_size
         self.font_value = r_font_value
 
-        self.canvas.itemconfig(self.text_watermarker, text=r_text, fill=r_color_text,
-                               font=(r_font_value, r_font_size, "bold"))
+        # Coalesce successive applies into a single canvas update
+        if not self._pending_update:
+            self._pending_update = True
+            self.after_idle(self._flush_watermark)
+
+    def _flush_watermark(self):
+        """
+        Applies the latest received watermark values to the canvas text item.
+        """
+        self._pending_update = False
+        if self.text_watermarker is None:
+            self.text_watermarker = self.canvas.create_text(300, 500, width=500, text="")
+        # Reusing the same Font object keeps Tk from parsing a new font description on every apply
+        key = (self.font_value, self.font_size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = tk.font.Font(root=self, family=key[0], size=key[1], weight="bold")
+        self.canvas.itemconfig(self.text_watermarker, text=self.watermark_text, fill=self.text_color, font=font)